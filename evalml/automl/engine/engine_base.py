@@ -27,6 +27,8 @@ from evalml.problem_types import (
 class EngineComputation(ABC):
     """Wrapper around the result of a (possibly asynchronous) engine computation."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_result(self):
         """Gets the computation result. Will block until the computation is finished.
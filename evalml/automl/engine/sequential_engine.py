@@ -1,5 +1,10 @@
 """A Future-like api for jobs created by the SequentialEngine, an Engine that sequentially computes the submitted jobs."""
 
+from collections import OrderedDict
+
+import joblib
+import pandas as pd
+
 from evalml.automl.engine.engine_base import (
     EngineBase,
     EngineComputation,
@@ -8,6 +13,7 @@ from evalml.automl.engine.engine_base import (
     train_pipeline,
 )
 from evalml.objectives.utils import get_objective
+from evalml.pipelines.components import Transformer
 
 
 class SequentialComputation(EngineComputation):
@@ -23,6 +29,8 @@ class SequentialComputation(EngineComputation):
         work (callable): Computation that should be done by the engine.
     """
 
+    __slots__ = ("work", "kwargs", "meta_data")
+
     def __init__(self, work, **kwargs):
         self.work = work
         self.kwargs = kwargs
@@ -51,12 +59,193 @@ class SequentialComputation(EngineComputation):
         """Cancel the current computation."""
 
 
+class PipelineCache:
+    """In-memory cache of the fitted transformers produced while evaluating pipelines.
+
+    Pipelines evaluated during search frequently share the same preprocessing components. Every fitted transformer
+    is keyed on the search data, its parameters and the keys of all of its upstream components, so a transformer is
+    only reused by pipelines that would fit it on identical inputs. Reused transformers are handed to the pipeline
+    through the component graph's cached_data, which skips refitting them.
+
+    Args:
+        max_size (int): Maximum number of component keys to keep. The least recently used keys are evicted first. Defaults to 128.
+    """
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self._data = None
+
+    def _data_key(self, X, y, X_schema, y_schema):
+        """Fingerprint of the search data and the Woodwork schemas the pipelines are evaluated with.
+
+        The values are only rehashed when new data objects are submitted. The schemas are part of the key
+        because the same values can be typed differently, e.g. a column of integers used as a categorical.
+        """
+        if self._data is None or self._data[0] is not X or self._data[1] is not y:
+            try:
+                values_key = (
+                    tuple(X.columns),
+                    int(pd.util.hash_pandas_object(X).sum()),
+                    int(pd.util.hash_pandas_object(y).sum()),
+                )
+            except TypeError:
+                values_key = None
+            self._data = (X, y, values_key)
+        values_key = self._data[2]
+        if values_key is None:
+            return None
+
+        X_schema = X.ww.schema if X_schema is None else X_schema
+        y_schema = y.ww.schema if y_schema is None else y_schema
+        schema_description = (
+            (
+                None
+                if X_schema is None
+                else [
+                    (name, column.logical_type, sorted(column.semantic_tags))
+                    for name, column in X_schema.columns.items()
+                ]
+            ),
+            (
+                None
+                if y_schema is None
+                else (y_schema.logical_type, sorted(y_schema.semantic_tags))
+            ),
+        )
+        try:
+            schema_key = joblib.hash(schema_description)
+        except Exception:
+            return None
+        return values_key + (schema_key,)
+
+    @staticmethod
+    def _component_keys(pipeline):
+        """Hashes each component on its parameters and the hashes of its parents in the component graph.
+
+        Parameters are hashed by content with joblib, so large array parameters can't collide on their repr.
+        Returns None if any parameter can't be hashed, in which case the pipeline isn't cached.
+        """
+        component_graph = pipeline.component_graph
+        pipeline_info = (type(pipeline).__name__, pipeline.parameters.get("pipeline"))
+        keys = {}
+        for component_name in component_graph.compute_order:
+            component = component_graph.get_component(component_name)
+            parents = tuple(
+                (keys[edge[:-2]], edge[-2:]) if edge[-2:] in (".x", ".y") else edge
+                for edge in component_graph.get_inputs(component_name)
+            )
+            description = (
+                pipeline_info,
+                component_name,
+                type(component).__module__,
+                type(component).__qualname__,
+                sorted(component.parameters.items()),
+                component.random_seed,
+                parents,
+            )
+            try:
+                keys[component_name] = joblib.hash(description)
+            except Exception:
+                return None
+        return keys
+
+    def evaluate_pipeline(
+        self,
+        pipeline,
+        automl_config,
+        X,
+        y,
+        logger,
+        X_holdout=None,
+        y_holdout=None,
+    ):
+        """Evaluates a pipeline, reusing any cached transformers and caching the ones it fits.
+
+        Args:
+            pipeline (PipelineBase): The pipeline to score.
+            automl_config (AutoMLConfig): The AutoMLSearch object, used to access config and the error callback.
+            X (pd.DataFrame): Training features.
+            y (pd.Series): Training target.
+            logger: Logger object to write to.
+            X_holdout (pd.DataFrame): Holdout set features.
+            y_holdout (pd.DataFrame): Holdout set target.
+
+        Returns:
+            dict: The results of evaluate_pipeline.
+        """
+        data_key = self._data_key(
+            X,
+            y,
+            automl_config.X_schema,
+            automl_config.y_schema,
+        )
+        component_keys = None
+        # Ensembles are given cached_data by the AutoML algorithm, so leave them untouched.
+        if data_key is not None and pipeline.component_graph.cached_data is None:
+            component_keys = self._component_keys(pipeline)
+        if component_keys is None:
+            return evaluate_pipeline(
+                pipeline,
+                automl_config=automl_config,
+                X=X,
+                y=y,
+                logger=logger,
+                X_holdout=X_holdout,
+                y_holdout=y_holdout,
+            )
+
+        cached_data = {}
+        for component_name, component_key in component_keys.items():
+            key = (data_key, component_key)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                for hashes, component in self._cache[key].items():
+                    cached_data.setdefault(hashes, {})[component_name] = component
+
+        pipeline = pipeline.clone()
+        pipeline.component_graph.cached_data = cached_data
+        results = evaluate_pipeline(
+            pipeline,
+            automl_config=automl_config,
+            X=X,
+            y=y,
+            logger=logger,
+            X_holdout=X_holdout,
+            y_holdout=y_holdout,
+        )
+        # Keep the cache out of the pipelines handed back to AutoMLSearch.
+        results["pipeline"].component_graph.cached_data = None
+
+        for hashes, component_instances in results["cached_data"].items():
+            for component_name, component in component_instances.items():
+                if isinstance(component, Transformer) and component._is_fitted:
+                    key = (data_key, component_keys[component_name])
+                    self._cache.setdefault(key, {})[hashes] = component
+                    self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return results
+
+
 class SequentialEngine(EngineBase):
     """The default engine for the AutoML search.
 
-    Trains and scores pipelines locally and sequentially.
+    Trains and scores pipelines locally and sequentially. To evaluate pipelines in parallel, use
+    CFEngine or DaskEngine instead, or pass engine="cf_threaded" or engine="cf_process" to AutoMLSearch.
+
+    Transformers fitted while evaluating a pipeline are cached and reused by later pipelines that fit the same
+    components on the same data, see PipelineCache.
+
+    Args:
+        cache_size (int): Maximum number of fitted components kept by the pipeline cache. Set to 0 to disable caching. Defaults to 128.
     """
 
+    def __init__(self, cache_size=128):
+        self._pipeline_cache = (
+            PipelineCache(max_size=cache_size) if cache_size else None
+        )
+
     def submit_evaluation_job(
         self,
         automl_config,
@@ -79,9 +268,14 @@ class SequentialEngine(EngineBase):
         Returns:
             SequentialComputation: Computation result.
         """
+        # Each job needs its own JobLogger: AutoMLSearch replays a job's messages once it completes,
+        # so a logger shared across jobs would replay every earlier job's messages again.
         logger = self.setup_job_log()
+        work = evaluate_pipeline
+        if self._pipeline_cache is not None:
+            work = self._pipeline_cache.evaluate_pipeline
         return SequentialComputation(
-            work=evaluate_pipeline,
+            work=work,
             pipeline=pipeline,
             automl_config=automl_config,
             X=X,
@@ -1,5 +1,7 @@
 """Utility methods for EvalML objectives."""
 
+from functools import lru_cache
+
 from evalml import objectives
 from evalml.exceptions import ObjectiveCreationError, ObjectiveNotFoundError
 from evalml.objectives.objective_base import ObjectiveBase
@@ -106,6 +108,14 @@ def get_ranking_objectives(problem_type):
 
 
 def _all_objectives_dict():
+    return dict(_objectives_registry())
+
+
+@lru_cache(maxsize=1)
+def _objectives_registry():
+    # Every objective evalml ships is defined once evalml.objectives is imported, so
+    # the subclass walk only needs to happen once. Callers that may mutate the
+    # result should go through _all_objectives_dict, which returns a copy.
     all_objectives = _get_subclasses(ObjectiveBase)
     objectives_dict = {}
     for objective in all_objectives:
@@ -164,11 +174,11 @@ def get_objective(objective, return_instance=False, **kwargs):
         raise TypeError("Objective parameter cannot be NoneType")
     if isinstance(objective, ObjectiveBase):
         return objective
-    all_objectives_dict = _all_objectives_dict()
     if not isinstance(objective, str):
         raise TypeError(
             "If parameter objective is not a string, it must be an instance of ObjectiveBase!",
         )
+    all_objectives_dict = _objectives_registry()
     if objective.lower() not in all_objectives_dict:
         raise ObjectiveNotFoundError(
             f"{objective} is not a valid Objective! "
@@ -37,10 +37,14 @@ class ClassificationPipeline(PipelineBase):
             parameters=parameters,
             random_seed=random_seed,
         )
+
+    @property
+    def _encoder(self):
+        """The pipeline's label encoder, looked up on the component graph since fitting may replace it with a cached instance."""
         try:
-            self._encoder = self.component_graph.get_component("Label Encoder")
+            return self.component_graph.get_component("Label Encoder")
         except ValueError:
-            self._encoder = None
+            return None
 
     def fit(self, X, y):
         """Build a classification model. For string and categorical targets, classes are sorted by sorted(set(y)) and then are mapped to values between 0 and n_classes-1.
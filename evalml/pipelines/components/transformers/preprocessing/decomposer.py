@@ -284,7 +284,7 @@ class Decomposer(Transformer):
 
         Args:
             y (pandas.Series): Target data to be transformed
-            periodic_signal (pandas.Series): Single period of the detected seasonal signal
+            periodic_signal (pandas.Series or np.ndarray): Single period of the detected seasonal signal
             periodicity (int): Number of time units in a single cycle of the seasonal signal
             frequency (str): String representing the detected frequency of the time series data.
                 Uses the same codes as the freqstr attribute of a pandas Series with DatetimeIndex.
@@ -299,26 +299,34 @@ class Decomposer(Transformer):
 
         # Determine where the seasonality starts
         if isinstance(y.index, pd.DatetimeIndex):
-            transform_first_ind = (
-                len(pd.date_range(start=index[0], end=y.index[0], freq=frequency))
-                % periodicity
-                - 1
-            )
+            if index.freqstr == frequency and y.index[0] <= index[-1]:
+                # The fitted index already holds every date up to the start of y, so count them
+                # rather than generating the dates again.
+                num_dates = index.searchsorted(y.index[0], side="right")
+            elif index.freqstr == frequency:
+                # Only generate the dates past the end of the fitted index.
+                num_dates = (
+                    len(index)
+                    - 1
+                    + len(
+                        pd.date_range(start=index[-1], end=y.index[0], freq=frequency),
+                    )
+                )
+            else:
+                num_dates = len(
+                    pd.date_range(start=index[0], end=y.index[0], freq=frequency),
+                )
+            transform_first_ind = num_dates % periodicity - 1
         elif isinstance(y.index, pd.RangeIndex) or y.index.is_numeric():
             first_index_diff = y.index[0] - index[0]
             transform_first_ind = first_index_diff % periodicity
 
-        # Cycle the sample of seasonal data so the transformed data's effective index is first
-        rotated_seasonal_sample = np.roll(
-            periodic_signal.T.values,
-            -transform_first_ind,
-        )
-
-        # Repeat the single, rotated period of seasonal data to cover the entirety of the data
-        # to be transformed.
-        seasonal = np.tile(rotated_seasonal_sample, len(y) // periodicity + 1).T[
-            : len(y)
-        ]  # The extrapolated seasonal data will be too long, so truncate.
+        # Index the single period of seasonal data cyclically, starting from the transformed data's
+        # effective first index, to cover the entirety of the data to be transformed in one pass.
+        seasonal_index = np.arange(len(y), dtype=np.int64)
+        seasonal_index += transform_first_ind
+        np.mod(seasonal_index, periodicity, out=seasonal_index)
+        seasonal = np.asarray(periodic_signal).take(seasonal_index)
 
         # Add the date times back in.
         return pd.Series(seasonal, index=y.index)
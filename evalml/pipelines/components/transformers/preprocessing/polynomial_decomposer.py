@@ -3,17 +3,84 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
+from scipy.signal import convolve
 from skopt.space import Integer
 from sktime.forecasting.base._fh import ForecastingHorizon
-from statsmodels.tsa.seasonal import seasonal_decompose
 from statsmodels.tsa.tsatools import freq_to_period
 
 from evalml.pipelines.components.transformers.preprocessing import Decomposer
 from evalml.utils import import_or_raise, infer_feature_types
 
 
+@lru_cache(maxsize=1)
+def _get_sktime_trend_modules():
+    """Imports the sktime modules used to build the detrender once, rather than on every instantiation."""
+    error_msg = "sktime is not installed. Please install using 'pip install sktime'"
+    trend = import_or_raise("sktime.forecasting.trend", error_msg=error_msg)
+    detrend = import_or_raise(
+        "sktime.transformations.series.detrend",
+        error_msg=error_msg,
+    )
+    return trend, detrend
+
+
+# Only a handful of frequency strings are ever seen, so avoid re-parsing them on every fit.
+_freq_to_period = lru_cache(maxsize=32)(freq_to_period)
+
+
+def _additive_seasonal(y: np.ndarray, period: int) -> np.ndarray:
+    """Computes the additive seasonal component of a signal, matching statsmodels' seasonal_decompose().
+
+    The trend is estimated with a centered moving average, the detrended signal is averaged over each
+    position in the period and the averages are normalized to zero mean. Unlike seasonal_decompose(),
+    the trend and residual series are never built. A 2D array is treated as one signal per column.
+
+    Args:
+        y (np.ndarray): Signal, or signals stacked as columns, to extract the seasonality from.
+        period (int): Number of entries in a single cycle of the seasonal signal.
+
+    Returns:
+        np.ndarray: The seasonal signal repeated over the length of y, with the same shape as y.
+
+    Raises:
+        ValueError: If y has any missing values or fewer than two complete cycles.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = y.shape[0]
+    if not np.all(np.isfinite(y)):
+        raise ValueError("This function does not handle missing values")
+    if n < 2 * period:
+        raise ValueError(
+            f"x must have 2 complete cycles requires {2 * period} "
+            f"observations. x only has {n} observation(s)",
+        )
+
+    if period % 2 == 0:  # split weights at ends
+        filt = np.array([0.5] + [1] * (period - 1) + [0.5]) / period
+    else:
+        filt = np.repeat(1.0 / period, period)
+    filt = filt.reshape((len(filt),) + (1,) * (y.ndim - 1))
+    trend = np.full(y.shape, np.nan)
+    trim_head = int(np.ceil(len(filt) / 2.0) - 1)
+    trend[trim_head : trim_head + n - len(filt) + 1] = convolve(y, filt, mode="valid")
+
+    # Lay the detrended signal out one cycle per row and average each position in the cycle.
+    n_cycles = -(-n // period)
+    detrended = np.full((n_cycles * period,) + y.shape[1:], np.nan)
+    detrended[:n] = y - trend
+    period_averages = np.nanmean(
+        detrended.reshape((n_cycles, period) + y.shape[1:]),
+        axis=0,
+    )
+    period_averages -= period_averages.mean(axis=0)
+
+    return period_averages[np.arange(n) % period]
+
+
 class PolynomialDecomposer(Decomposer):
     """Removes trends and seasonality from time series by fitting a polynomial and moving average to the data.
 
@@ -57,13 +124,7 @@ class PolynomialDecomposer(Decomposer):
     ):
         self.logger = logging.getLogger(__name__)
 
-        error_msg = "sktime is not installed. Please install using 'pip install sktime'"
-        trend = import_or_raise("sktime.forecasting.trend", error_msg=error_msg)
-        detrend = import_or_raise(
-            "sktime.transformations.series.detrend",
-            error_msg=error_msg,
-        )
-
+        trend, detrend = _get_sktime_trend_modules()
         decomposer = detrend.Detrender(trend.PolynomialTrendForecaster(degree=degree))
 
         super().__init__(
@@ -79,8 +140,8 @@ class PolynomialDecomposer(Decomposer):
         """Fits the PolynomialDecomposer and determine the seasonal signal.
 
         Currently only fits the polynomial detrender.  The seasonality is determined by removing
-        the trend from the signal and using statsmodels' seasonal_decompose().  Both the trend
-        and seasonality are currently assumed to be additive.
+        the trend from the signal and computing the same additive seasonal component as statsmodels'
+        seasonal_decompose().  Both the trend and seasonality are currently assumed to be additive.
 
         Args:
             X (pd.DataFrame, optional): Conditionally used to build datetime index.
@@ -108,26 +169,59 @@ class PolynomialDecomposer(Decomposer):
         # Copying y as we might modify its index
         y_orig = infer_feature_types(y).copy()
         self._component_obj.fit(y_orig)
-
-        y_detrended_with_time_index = self._component_obj.transform(y_orig)
+        linear_model = self._component_obj.forecaster_.regressor_[-1]
+        self._trend_coefficients = np.ravel(linear_model.coef_).astype(np.float64)
+        self._trend_coefficients[0] += np.ravel(linear_model.intercept_)[0]
+
+        # Detrend with the coefficients just fit rather than making a second pass through the detrender.
+        y_detrended_with_time_index = pd.Series(
+            y_orig.to_numpy(dtype=np.float64, na_value=np.nan)
+            - self._polynomial_trend(y_orig.index),
+            index=y_orig.index,
+            name=y_orig.name,
+        )
 
         # Save the frequency of the fitted series for checking against transform data.
         self.frequency = y_detrended_with_time_index.index.freqstr
 
-        # statsmodel's seasonal_decompose() repeats the seasonal signal over the length of
+        # _additive_seasonal() repeats the seasonal signal over the length of
         # the given array.  We'll extract the first iteration and save it for use in .transform()
         # TODO: Resolve with https://github.com/alteryx/evalml/issues/3708
         if self.period == -1:
-            self.period = freq_to_period(self.frequency)
-
-        self.seasonal = seasonal_decompose(
-            y_detrended_with_time_index,
-            period=self.period,
-        ).seasonal
-        self.seasonality = self.seasonal[0 : self.period]
+            self.period = _freq_to_period(self.frequency)
+
+        if self.period <= 1:
+            # A one-entry cycle has no seasonality to remove, so skip the decomposition.
+            seasonal_values = np.zeros(len(y_detrended_with_time_index))
+        else:
+            seasonal_values = _additive_seasonal(
+                y_detrended_with_time_index.to_numpy(),
+                self.period,
+            )
+        self.seasonal = pd.Series(
+            seasonal_values,
+            index=y_detrended_with_time_index.index,
+            name="seasonal",
+        )
+        self.seasonality = np.ascontiguousarray(
+            seasonal_values[0 : self.period],
+            dtype=np.float64,
+        )
         self.trend = y - (y_detrended_with_time_index - self.seasonal) - self.seasonal
         return self
 
+    def _polynomial_trend(self, index: pd.Index) -> np.ndarray:
+        """Evaluates the fitted polynomial trend at the given index.
+
+        Encodes time the same way as sktime's PolynomialTrendForecaster, but evaluates the polynomial
+        directly instead of building a forecasting horizon and calling the forecaster on every transform.
+        """
+        if isinstance(index, pd.DatetimeIndex):
+            t = index.asi8 / 864e11
+        else:
+            t = index.to_numpy(dtype=np.int64).astype(np.float64)
+        return np.polynomial.polynomial.polyval(t, self._trend_coefficients)
+
     def transform(
         self,
         X: pd.DataFrame,
@@ -163,18 +257,25 @@ class PolynomialDecomposer(Decomposer):
 
         # Remove polynomial trend then seasonality of detrended signal
         y_ww = infer_feature_types(y)
-        y_detrended = self._component_obj.transform(y_ww)
-
-        seasonal = self._project_seasonal(
-            y,
-            self.seasonality,
-            self.period,
-            self.frequency,
+        y_t_values = y_ww.to_numpy(
+            dtype=np.float64,
+            na_value=np.nan,
+        ) - self._polynomial_trend(
+            y_ww.index,
         )
+        if self.period > 1:
+            seasonal = self._project_seasonal(
+                y,
+                self.seasonality,
+                self.period,
+                self.frequency,
+            )
 
-        y_t = pd.Series(y_detrended - seasonal)
+            # Both signals share y's index, so subtract the raw values rather than aligning indices.
+            # The detrended values are a fresh array, so the seasonality can be removed in place.
+            y_t_values -= seasonal.to_numpy()
+        y_t = pd.Series(y_t_values, index=original_index, copy=False)
         y_t.ww.init(logical_type="double")
-        y_t.index = original_index
         return X, y_t
 
     def inverse_transform(self, y_t: pd.Series) -> tuple[pd.DataFrame, pd.Series]:
@@ -210,26 +311,15 @@ class PolynomialDecomposer(Decomposer):
             left_index = y_t.index[0]
             right_index = min(y_t.index[-1], index[-1])
 
-            if isinstance(y_t.index, pd.RangeIndex) or y_t.index.is_numeric():
-                y_t_ind = pd.RangeIndex(
-                    start=left_index,
-                    stop=right_index + 1,
-                )  # stop value is not inclusive
-            elif isinstance(y_t.index, pd.DatetimeIndex):
-                y_t_ind = pd.DatetimeIndex(
-                    pd.date_range(left_index, end=right_index),
-                )  # end value is inclusive
-
-            # Build index
-            y_t_in_sample = y_t[y_t_ind]
-
-            # Convert y_t to datetime index to use the built in component
-            if isinstance(y_t.index, pd.RangeIndex) or y_t.index.is_numeric():
-                y_t_dt_ind = self._convert_int_index_to_dt_index(y_t_in_sample.index)
-            elif isinstance(y_t.index, pd.DatetimeIndex):
-                y_t_dt_ind = y_t_ind
-            trend = self._component_obj.inverse_transform(
-                y_t_in_sample.set_axis(y_t_dt_ind),
+            # Take the in-sample portion straight from the fitted indices, which works for any
+            # frequency and avoids generating or converting the dates on every call.
+            in_sample_slice = index.slice_indexer(left_index, right_index)
+            y_t_in_sample = y_t[index[in_sample_slice]]
+            y_t_dt_ind = self.in_sample_datetime_index[in_sample_slice]
+            trend = pd.Series(
+                y_t_in_sample.to_numpy(dtype=np.float64, na_value=np.nan)
+                + self._polynomial_trend(y_t_dt_ind),
+                index=y_t_dt_ind,
             )
 
             # self.seasonal will always have a datetime index
@@ -246,12 +336,13 @@ class PolynomialDecomposer(Decomposer):
                 # ...that is entirely out of sample.
                 truncated_y_t = y_t
 
-            projected_seasonality = self._project_seasonal(
-                truncated_y_t,
-                self.seasonality,
-                self.period,
-                self.frequency,
-            )
+            if self.period > 1:
+                projected_seasonality = self._project_seasonal(
+                    truncated_y_t,
+                    self.seasonality,
+                    self.period,
+                    self.frequency,
+                )
 
             if (
                 isinstance(truncated_y_t.index, pd.RangeIndex)
@@ -259,14 +350,19 @@ class PolynomialDecomposer(Decomposer):
             ):
                 dt_index = self._convert_int_index_to_dt_index(truncated_y_t.index)
                 truncated_y_t.index = dt_index
-                projected_seasonality.index = dt_index
-            retrended_y = self._component_obj.inverse_transform(truncated_y_t)
-
+            y_out_of_sample_values = truncated_y_t.to_numpy(
+                dtype=np.float64,
+                na_value=np.nan,
+            ) + self._polynomial_trend(truncated_y_t.index)
+            if self.period > 1:
+                # The projected seasonality lines up positionally with the retrended signal,
+                # so add the raw values rather than aligning indices.
+                y_out_of_sample_values = np.add(
+                    y_out_of_sample_values,
+                    projected_seasonality.to_numpy(),
+                )
             y_out_of_sample = infer_feature_types(
-                pd.Series(
-                    retrended_y + projected_seasonality,
-                    index=truncated_y_t.index,
-                ),
+                pd.Series(y_out_of_sample_values, index=truncated_y_t.index),
             )
         y = pd.concat([y_in_sample, y_out_of_sample])
         y.index = original_index
@@ -275,8 +371,8 @@ class PolynomialDecomposer(Decomposer):
     def get_trend_dataframe(self, X: pd.DataFrame, y: pd.Series) -> list[pd.DataFrame]:
         """Return a list of dataframes with 4 columns: signal, trend, seasonality, residual.
 
-        Scikit-learn's PolynomialForecaster is used to generate the trend portion of the target data. statsmodel's
-        seasonal_decompose is used to generate the seasonality of the data.
+        Scikit-learn's PolynomialForecaster is used to generate the trend portion of the target data. The seasonality
+        is computed the same way as statsmodel's seasonal_decompose, for all target series at once.
 
         Args:
             X (pd.DataFrame): Input data with time series data in index.
@@ -309,36 +405,40 @@ class PolynomialDecomposer(Decomposer):
 
         fh = ForecastingHorizon(X.index, is_relative=False)
 
-        result_dfs = []
-
-        def _decompose_target(X, y, fh):
-            """Function to generate a single DataFrame with trend, seasonality and residual components."""
-            forecaster = (
-                self._component_obj.forecaster_
-            )  # the .forecaster attribute is an unfitted version
-
-            trend = forecaster.predict(fh=fh, X=y)
-            if not isinstance(trend, pd.Series):
-                trend = pd.Series(trend.iloc[:, 0])
-
-            seasonality = seasonal_decompose(
-                y - trend,
-                period=self.period,
-            ).seasonal
-            residual = y - trend - seasonality
-            return pd.DataFrame(
-                {
-                    "signal": y,
-                    "trend": trend,
-                    "seasonality": seasonality,
-                    "residual": residual,
-                },
-            )
+        # The fitted trend only depends on the forecasting horizon, so predict it once
+        # rather than once per series.
+        forecaster = (
+            self._component_obj.forecaster_
+        )  # the .forecaster attribute is an unfitted version
+        trend = forecaster.predict(fh=fh)
+        if not isinstance(trend, pd.Series):
+            trend = pd.Series(trend.iloc[:, 0])
 
         if isinstance(y, pd.Series):
-            result_dfs.append(_decompose_target(X, y, fh))
-        elif isinstance(y, pd.DataFrame):
-            for colname in y.columns:
-                result_dfs.append(_decompose_target(X, y[colname], fh))
+            y = y.to_frame()
+        elif not isinstance(y, pd.DataFrame):
+            return []
+
+        # The seasonal component of every series is extracted in a single vectorized pass.
+        detrended = y.sub(trend, axis=0)
+        seasonality = pd.DataFrame(
+            _additive_seasonal(detrended.to_numpy(), self.period),
+            index=detrended.index,
+            columns=detrended.columns,
+        )
+
+        result_dfs = []
+        for colname in y.columns:
+            signal = y[colname]
+            result_dfs.append(
+                pd.DataFrame(
+                    {
+                        "signal": signal,
+                        "trend": trend,
+                        "seasonality": seasonality[colname],
+                        "residual": signal - trend - seasonality[colname],
+                    },
+                ),
+            )
 
         return result_dfs
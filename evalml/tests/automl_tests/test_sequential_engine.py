@@ -0,0 +1,240 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from evalml.automl.automl_search import AutoMLSearch
+from evalml.automl.engine.engine_base import JobLogger
+from evalml.automl.engine.sequential_engine import (
+    PipelineCache,
+    SequentialComputation,
+    SequentialEngine,
+)
+from evalml.pipelines import BinaryClassificationPipeline
+from evalml.pipelines.components import Imputer, Transformer
+
+
+class WeightedTransformer(Transformer):
+    name = "Weighted Transformer"
+
+    def __init__(self, weights=None, random_seed=0):
+        super().__init__(
+            parameters={"weights": weights},
+            component_obj=None,
+            random_seed=random_seed,
+        )
+
+    def transform(self, X, y=None):
+        return X
+
+
+def _get_automl(X, y):
+    return AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        max_batches=1,
+        optimize_thresholds=False,
+    )
+
+
+def _evaluate(engine, automl, pipeline):
+    return engine.submit_evaluation_job(
+        automl.automl_config,
+        pipeline,
+        automl.X_train,
+        automl.y_train,
+    ).get_result()
+
+
+def test_pipeline_cache_reuses_shared_transformers(X_y_binary):
+    X, y = X_y_binary
+    automl = _get_automl(X, y)
+    engine = SequentialEngine()
+    lr_pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    dt_pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Decision Tree Classifier"],
+    )
+
+    first = _evaluate(engine, automl, lr_pipeline)
+    with patch.object(Imputer, "fit", wraps=Imputer.fit, autospec=True) as mock_fit:
+        second = _evaluate(engine, automl, dt_pipeline)
+    mock_fit.assert_not_called()
+
+    for hashes, component_instances in second["cached_data"].items():
+        assert component_instances["Imputer"] is first["cached_data"][hashes]["Imputer"]
+    assert second["pipeline"].component_graph.cached_data is None
+    assert dt_pipeline.component_graph.cached_data is None
+
+
+def test_pipeline_cache_scores_match_uncached(X_y_binary):
+    X, y = X_y_binary
+    automl = _get_automl(X, y)
+    pipelines = [
+        BinaryClassificationPipeline(
+            ["Imputer", "One Hot Encoder", "Logistic Regression Classifier"],
+            parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+        ),
+        BinaryClassificationPipeline(
+            ["Imputer", "One Hot Encoder", "Decision Tree Classifier"],
+        ),
+    ]
+    cached_engine = SequentialEngine()
+    uncached_engine = SequentialEngine(cache_size=0)
+    for pipeline in pipelines:
+        cached = _evaluate(cached_engine, automl, pipeline)["scores"]
+        uncached = _evaluate(uncached_engine, automl, pipeline)["scores"]
+        pd.testing.assert_series_equal(cached["cv_scores"], uncached["cv_scores"])
+
+
+def test_pipeline_cache_keys_depend_on_parameters_and_parents():
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Logistic Regression Classifier"],
+    )
+    keys = PipelineCache._component_keys(pipeline)
+    assert keys == PipelineCache._component_keys(pipeline.clone())
+
+    new_imputer = pipeline.new(
+        {"Imputer": {"numeric_impute_strategy": "median"}},
+    )
+    new_keys = PipelineCache._component_keys(new_imputer)
+    assert new_keys["Imputer"] != keys["Imputer"]
+    assert new_keys["One Hot Encoder"] != keys["One Hot Encoder"]
+
+
+def test_pipeline_cache_keys_hash_array_parameters_by_content():
+    weights = np.zeros(2000)
+    other_weights = weights.copy()
+    other_weights[1000] = 1
+    assert repr(weights) == repr(other_weights)
+
+    def _keys(weights):
+        pipeline = BinaryClassificationPipeline(
+            [WeightedTransformer, "Logistic Regression Classifier"],
+            parameters={"Weighted Transformer": {"weights": weights}},
+        )
+        return PipelineCache._component_keys(pipeline)
+
+    assert _keys(weights) == _keys(weights.copy())
+    assert (
+        _keys(weights)["Weighted Transformer"]
+        != _keys(other_weights)["Weighted Transformer"]
+    )
+
+
+def test_pipeline_cache_keys_depend_on_component_module():
+    OtherWeightedTransformer = type(
+        "WeightedTransformer",
+        (WeightedTransformer,),
+        {"__module__": "other_module"},
+    )
+    keys = [
+        PipelineCache._component_keys(
+            BinaryClassificationPipeline(
+                [component_class, "Logistic Regression Classifier"],
+            ),
+        )["Weighted Transformer"]
+        for component_class in [WeightedTransformer, OtherWeightedTransformer]
+    ]
+    assert keys[0] != keys[1]
+
+
+def test_pipeline_cache_skips_pipelines_with_unhashable_parameters():
+    pipeline = BinaryClassificationPipeline(
+        [WeightedTransformer, "Logistic Regression Classifier"],
+        parameters={"Weighted Transformer": {"weights": lambda x: x}},
+    )
+    assert PipelineCache._component_keys(pipeline) is None
+
+
+def test_pipeline_cache_evicts_least_recently_used(X_y_binary):
+    X, y = X_y_binary
+    automl = _get_automl(X, y)
+    cache = PipelineCache(max_size=2)
+
+    def _evaluate_with_cache(pipeline):
+        cache.evaluate_pipeline(
+            pipeline,
+            automl.automl_config,
+            automl.X_train,
+            automl.y_train,
+            logger=JobLogger(),
+        )
+        return PipelineCache._component_keys(pipeline)
+
+    def _cached_component_keys():
+        return [component_key for _, component_key in cache._cache]
+
+    first_keys = _evaluate_with_cache(
+        BinaryClassificationPipeline(
+            ["Imputer", "One Hot Encoder", "Logistic Regression Classifier"],
+            parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+        ),
+    )
+    assert sorted(_cached_component_keys()) == sorted(
+        [first_keys["Imputer"], first_keys["One Hot Encoder"]],
+    )
+
+    # Shares the Imputer, which makes it the most recently used key.
+    _evaluate_with_cache(
+        BinaryClassificationPipeline(["Imputer", "Decision Tree Classifier"]),
+    )
+    assert _cached_component_keys() == [
+        first_keys["One Hot Encoder"],
+        first_keys["Imputer"],
+    ]
+
+    third_keys = _evaluate_with_cache(
+        BinaryClassificationPipeline(
+            ["Imputer", "Decision Tree Classifier"],
+            parameters={"Imputer": {"numeric_impute_strategy": "median"}},
+        ),
+    )
+    assert _cached_component_keys() == [first_keys["Imputer"], third_keys["Imputer"]]
+
+
+def test_pipeline_cache_keys_depend_on_schema(X_y_binary):
+    X, y = X_y_binary
+    X = X.iloc[:, :3].copy()
+    X.columns = ["a", "b", "c"]
+    X["a"] = (X["a"] * 3).round().astype(int) % 4
+    X_categorical = X.copy()
+    X_categorical.ww.init(logical_types={"a": "Categorical"})
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+
+    engine = SequentialEngine()
+    _evaluate(engine, _get_automl(X, y), pipeline)
+    reused = _evaluate(engine, _get_automl(X_categorical, y), pipeline)["scores"]
+    fresh = _evaluate(SequentialEngine(), _get_automl(X_categorical, y), pipeline)[
+        "scores"
+    ]
+    pd.testing.assert_series_equal(reused["cv_scores"], fresh["cv_scores"])
+
+
+def test_evaluation_jobs_get_their_own_logger(X_y_binary):
+    X, y = X_y_binary
+    automl = _get_automl(X, y)
+    engine = SequentialEngine()
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+
+    first = _evaluate(engine, automl, pipeline)["logger"]
+    second = _evaluate(engine, automl, pipeline)["logger"]
+    assert isinstance(first, JobLogger)
+    assert first is not second
+    assert first.logs == second.logs
+
+
+def test_sequential_computation_has_no_instance_dict():
+    computation = SequentialComputation(work=lambda x: x + 1, x=1)
+    assert not hasattr(computation, "__dict__")
+    assert computation.get_result() == 2
+    assert computation.done()
@@ -4,8 +4,13 @@ import pytest
 import woodwork as ww
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
+from sktime.forecasting.base._fh import ForecastingHorizon
+from statsmodels.tsa.seasonal import seasonal_decompose
 
 from evalml.pipelines.components import PolynomialDecomposer
+from evalml.pipelines.components.transformers.preprocessing.polynomial_decomposer import (
+    _additive_seasonal,
+)
 from evalml.tests.component_tests.decomposer_tests.test_decomposer import (
     get_trend_dataframe_format_correct,
 )
@@ -125,3 +130,128 @@ def test_polynomial_decomposer_get_trend_dataframe_raises_errors(
     ):
         X.index.freq = None
         dec.get_trend_dataframe(X, y)
+
+
+@pytest.mark.parametrize("period", [2, 7, 12, 13])
+@pytest.mark.parametrize("n_samples", [26, 100, 101])
+def test_polynomial_decomposer_seasonal_matches_seasonal_decompose(period, n_samples):
+    rng = np.random.default_rng(0)
+    y = np.sin(np.arange(n_samples) * 2 * np.pi / period) + rng.normal(size=n_samples)
+
+    expected = seasonal_decompose(y, period=period).seasonal
+    np.testing.assert_allclose(_additive_seasonal(y, period), expected)
+
+    y_2d = np.column_stack([y, -2 * y + 1])
+    expected_2d = np.column_stack(
+        [seasonal_decompose(col, period=period).seasonal for col in y_2d.T],
+    )
+    np.testing.assert_allclose(_additive_seasonal(y_2d, period), expected_2d)
+
+
+def test_polynomial_decomposer_seasonal_raises_errors():
+    with pytest.raises(ValueError, match="2 complete cycles"):
+        _additive_seasonal(np.arange(13.0), 7)
+    with pytest.raises(ValueError, match="missing values"):
+        _additive_seasonal(np.array([1.0, np.nan] * 10), 2)
+
+
+def test_polynomial_decomposer_period_one_only_detrends():
+    dates = pd.date_range("2000-01-01", periods=30, freq="D")
+    X = pd.DataFrame(index=dates)
+    y = pd.Series(np.arange(30.0) * 2 + np.random.default_rng(0).normal(size=30), dates)
+
+    dec = PolynomialDecomposer(period=1)
+    X_t, y_t = dec.fit_transform(X, y)
+    assert (dec.seasonal == 0).all()
+    np.testing.assert_array_equal(dec.seasonality, np.zeros(1))
+    pd.testing.assert_series_equal(
+        y_t,
+        dec._component_obj.transform(y),
+        check_names=False,
+        check_freq=False,
+    )
+    pd.testing.assert_series_equal(dec.inverse_transform(y_t), y, check_dtype=False)
+
+    X_oos = pd.DataFrame(index=pd.date_range("2000-01-31", periods=5, freq="D"))
+    y_oos = pd.Series(np.arange(30.0, 35.0) * 2, X_oos.index)
+    _, y_oos_t = dec.transform(X_oos, y_oos)
+    pd.testing.assert_series_equal(dec.inverse_transform(y_oos_t), y_oos)
+
+
+@pytest.mark.parametrize("degree", [1, 2, 3])
+def test_polynomial_decomposer_trend_matches_detrender(degree, generate_seasonal_data):
+    X, y = generate_seasonal_data(real_or_synthetic="synthetic")(
+        period=7,
+        trend_degree=degree,
+    )
+    dec = PolynomialDecomposer(degree=degree)
+    dec.fit(X, y)
+
+    oos_index = pd.date_range(
+        dec.seasonal.index[0],
+        periods=len(y) + 30,
+        freq=dec.frequency,
+    )
+    expected = dec._component_obj.forecaster_.predict(
+        fh=ForecastingHorizon(oos_index, is_relative=False),
+    )
+    np.testing.assert_allclose(dec._polynomial_trend(oos_index), np.ravel(expected))
+    _, y_t = dec.transform(X, y)
+    pd.testing.assert_series_equal(dec.inverse_transform(y_t), y, check_dtype=False)
+
+
+def test_polynomial_decomposer_seasonality_is_contiguous_array(generate_seasonal_data):
+    X, y = generate_seasonal_data(real_or_synthetic="synthetic")(period=7)
+    dec = PolynomialDecomposer()
+    dec.fit(X, y)
+
+    assert isinstance(dec.seasonality, np.ndarray)
+    assert dec.seasonality.dtype == np.float64
+    assert dec.seasonality.flags.c_contiguous
+    np.testing.assert_array_equal(dec.seasonality, dec.seasonal.to_numpy()[:7])
+
+
+@pytest.mark.parametrize("freq", ["h", "W", "YS"])
+def test_polynomial_decomposer_inverse_transform_non_daily(freq):
+    dates = pd.date_range("2000-01-01", periods=120, freq=freq)
+    X = pd.DataFrame(index=dates)
+    y = pd.Series(np.arange(120.0) + np.sin(np.arange(120) * 2 * np.pi / 4), dates)
+
+    dec = PolynomialDecomposer()
+    _, y_t = dec.fit_transform(X, y)
+    pd.testing.assert_series_equal(dec.inverse_transform(y_t), y)
+    pd.testing.assert_series_equal(dec.inverse_transform(y_t[40:80]), y[40:80])
+
+    X_int, y_int = X.reset_index(drop=True), y.reset_index(drop=True)
+    X_int["date"] = dates
+    dec = PolynomialDecomposer(time_index="date")
+    _, y_int_t = dec.fit_transform(X_int, y_int)
+    pd.testing.assert_series_equal(dec.inverse_transform(y_int_t[40:80]), y_int[40:80])
+
+
+@pytest.mark.parametrize("y_logical_type", ["IntegerNullable", "AgeNullable"])
+def test_polynomial_decomposer_nullable_target_with_missing_values(y_logical_type):
+    dates = pd.date_range("2000-01-01", periods=60, freq="D")
+    X = pd.DataFrame(index=dates)
+    y = ww.init_series(
+        pd.Series(np.arange(60) * 2 + np.arange(60) % 7, index=dates),
+        logical_type=y_logical_type,
+    )
+    dec = PolynomialDecomposer()
+    _, y_t_expected = dec.fit_transform(X, y)
+
+    y_missing = y.copy()
+    y_missing.iloc[10] = pd.NA
+    y_missing = ww.init_series(y_missing, logical_type=y_logical_type)
+    _, y_t = dec.transform(X, y_missing)
+    assert np.isnan(y_t.iloc[10])
+    pd.testing.assert_series_equal(y_t.drop(dates[10]), y_t_expected.drop(dates[10]))
+
+    oos_dates = pd.date_range("2000-03-01", periods=10, freq="D")
+    y_t_oos = ww.init_series(
+        pd.Series([1, 2, pd.NA, 4, 5, 6, 7, 8, 9, 10], index=oos_dates, dtype="Int64"),
+        logical_type=y_logical_type,
+    )
+    y_oos = dec.inverse_transform(y_t_oos)
+    assert np.isnan(y_oos.iloc[2])
+    assert not y_oos.drop(oos_dates[2]).isna().any()
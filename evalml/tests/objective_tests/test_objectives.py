@@ -1,4 +1,5 @@
 from math import isclose
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -87,6 +88,16 @@ def test_get_objective_does_not_work_for_none_type():
         get_objective(None)
 
 
+def test_get_objective_does_not_rebuild_registry():
+    get_objective("log loss binary")
+    with patch("evalml.objectives.utils._get_subclasses") as mock_get_subclasses:
+        first = get_objective("log loss binary", return_instance=True)
+        second = get_objective("Log Loss Binary", return_instance=True)
+    mock_get_subclasses.assert_not_called()
+    assert isinstance(first, LogLossBinary)
+    assert first is not second
+
+
 def test_get_objective_kwargs():
     obj = get_objective(
         "cost benefit matrix",